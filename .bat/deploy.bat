@@ -43,4 +43,4 @@ EXIT /B
 
 ECHO Press any key to start the application.
 PAUSE
-flask run --port 8787
+python app.py
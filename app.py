@@ -1,8 +1,10 @@
-from flask import Flask, render_template, redirect, send_file, make_response
+from datetime import datetime, timezone
 
-from file import get_file_entries, retrieve_file
+from flask import Flask, Response, redirect, render_template, request, send_file
+
+from file import get_directory_listing, retrieve_file
 from logger import apply_log_config, log_exception
-from path import PathInfo
+from path import get_path_info
 
 apply_log_config()
 app = Flask(__name__)
@@ -25,8 +27,18 @@ def error():
 @app.route("/list/<path:file_path>")
 def get_file_list(file_path: str):
     try:
-        file_entries = get_file_entries(file_path)
-        return render_template("file_list.html", current_path=PathInfo(file_path), file_entries=file_entries)
+        listing = get_directory_listing(file_path)
+
+        # Check the conditions first, so the template is not rendered if the response is 304
+        resp = make_conditional(Response(), listing.etag, listing.last_modified, weak=True)
+        if resp.status_code == 304:
+            return resp
+
+        resp.set_data(render_template(
+            "file_list.html", current_path=get_path_info(file_path), file_entries=listing.entries
+        ))
+
+        return resp
     except FileNotFoundError:
         log_exception()
         return "Directory not found.", 404
@@ -41,7 +53,7 @@ def get_file_list(file_path: str):
 @app.route("/download/<path:file_path>")
 def download(file_path: str):
     try:
-        file_stream = retrieve_file(PathInfo(file_path))
+        file_stream = retrieve_file(get_path_info(file_path))
     except FileNotFoundError:
         log_exception()
         return "Path not found.", 404
@@ -49,11 +61,27 @@ def download(file_path: str):
         log_exception()
         return "Path to download the file is a directory.", 406
 
-    resp = make_response(send_file(file_stream.stream, as_attachment=True, attachment_filename=file_stream.file_name))
-    resp.headers["Content-Length"] = file_stream.file_size
+    # werkzeug drops ``W/`` when parsing ``If-Range``, so a weak validator would be treated as matching.
+    # Weak validators must never match ``If-Range`` (RFC 9110 §13.1.5), so the whole file is sent instead.
+    weak_if_range = request.headers.get("If-Range", "").startswith("W/")
+
+    return send_file(file_stream.path, as_attachment=True, download_name=file_stream.file_name,
+                     conditional=not weak_if_range, etag=file_stream.etag, last_modified=file_stream.last_modified)
 
-    return resp
+
+def make_conditional(resp: Response, etag: str, last_modified: float, weak: bool = False) -> Response:
+    """
+    Attach ``ETag`` and ``Last-Modified`` to ``resp``.
+
+    ``resp`` becomes ``304 Not Modified`` without the body if the client already has the same content.
+    """
+    resp.set_etag(etag, weak=weak)
+    resp.last_modified = datetime.fromtimestamp(last_modified, tz=timezone.utc)
+
+    return resp.make_conditional(request)
 
 
 if __name__ == "__main__":
-    app.run()
+    from waitress import serve
+
+    serve(app, host="127.0.0.1", port=8787)
@@ -1,34 +1,40 @@
 """Module for all file controls including file info parsing."""
+import os
 import stat
-from collections import defaultdict
+import time
+import zlib
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from enum import Enum, auto
-from math import log
-from pathlib import Path
-from typing import List, Dict, Generator, Optional, BinaryIO
+from functools import lru_cache
+from threading import Lock
+from typing import List, Dict, Optional, Tuple
 
-from path import PathInfo
+from path import PathInfo, get_path_info
 
-__all__ = ("get_file_entries", "retrieve_file")
+__all__ = ("get_directory_listing", "clear_directory_listing_cache", "retrieve_file")
+
+
+_conv_unit: List[str] = ["B", "KB", "MB", "GB", "TB"]
+
+
+@lru_cache(maxsize=4096)
+def _format_size(size_byte: int) -> str:
+    unit_base = min((size_byte.bit_length() - 1) // 10, len(_conv_unit) - 1) if size_byte else 0
+    unit = _conv_unit[unit_base]
+    div_base = 1024 ** unit_base
+
+    return f"{size_byte / div_base:,.1f} {unit}"
 
 
 class FileSize:
     """File size object for the convenience of rendering it to string."""
 
-    _cache: Dict[int, str] = defaultdict()
-    _conv_unit: List[str] = ["B", "KB", "MB", "GB", "TB"]
+    __slots__ = ("_size",)
 
     def __init__(self, size_byte: int):
         self._size = size_byte
 
-    def _format_size(self):
-        unit_base = min(int(log(self._size, 1024)), len(self._conv_unit))
-        unit = self._conv_unit[unit_base]
-        div_base = 1024 ** unit_base
-
-        return f"{self._size / div_base:,.1f} {unit}"
-
     @property
     def formatted(self) -> str:
         """
@@ -62,10 +68,7 @@ class FileSize:
         ``1002`` → ``1,002 B``
         ``10000046545656476620`` → ``8,881.8 TB``
         """
-        if self._size not in self._cache:
-            self._cache[self._size] = self._format_size()
-
-        return self._cache[self._size]
+        return _format_size(self._size)
 
     @property
     def original(self) -> str:
@@ -86,31 +89,43 @@ class EntryType(Enum):
         return EntryType.DIRECTORY if stat.S_ISDIR(mode) else EntryType.FILE
 
     def __str__(self):
-        if self == EntryType.DIRECTORY:
-            return "D"
-        elif self == EntryType.FILE:
-            return "F"
+        return _entry_type_str.get(self) or repr(self)
+
 
-        return repr(self)
+_entry_type_str: Dict[EntryType, str] = {
+    EntryType.DIRECTORY: "D",
+    EntryType.FILE: "F",
+}
 
 
 @dataclass
 class FileEntry:
+    __slots__ = ("entry_type", "file_name", "file_size", "modified_utc_str", "display_size", "display_size_original")
+
     entry_type: EntryType
     file_name: str
     file_size: FileSize
     modified_utc_str: str
 
+    def __post_init__(self):
+        # Pre-rendered on parse, so rendering the entries (which are cached) is just plain attribute access
+        self.display_size: str = self.file_size.formatted
+        self.display_size_original: str = self.file_size.original
+
     @staticmethod
-    def parse_from_path(pure_path: Path) -> "FileEntry":
-        """Parse ``entry`` yielded from ``Path("Y:/").iterdir()``."""
-        file_stats = pure_path.stat()
+    def parse_from_dir_entry(dir_entry: os.DirEntry) -> "FileEntry":
+        """
+        Parse ``dir_entry`` yielded from ``os.scandir("Y:/")``.
+
+        The stats of ``dir_entry`` are cached by :func:`os.scandir` on Windows, so no extra syscall is needed there.
+        """
+        file_stats = dir_entry.stat()
 
         entry_type = EntryType.parse_from_mode(file_stats.st_mode)
         file_size = FileSize(file_stats.st_size)
-        modified_utc = datetime.fromtimestamp(file_stats.st_mtime, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        modified_utc = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(file_stats.st_mtime))
 
-        return FileEntry(entry_type, pure_path.name, file_size, modified_utc)
+        return FileEntry(entry_type, dir_entry.name, file_size, modified_utc)
 
     @property
     def is_file(self) -> bool:
@@ -129,23 +144,115 @@ class FileEntry:
         raise ValueError(f"Unhandled entry type: {self.entry_type}")
 
 
-def get_file_entries(path: str = "") -> Generator[FileEntry, None, None]:
+@dataclass
+class DirectoryListing:
+    __slots__ = ("entries", "last_modified", "etag")
+
+    entries: List[FileEntry]
+    last_modified: float
+    etag: str
+
+    @staticmethod
+    def parse_from_path(path_with_root: str) -> "DirectoryListing":
+        """
+        Parse the directory at ``path_with_root``.
+
+        :raises FileNotFoundError: path not found
+        :raises NotADirectoryError: path is not a directory
+        """
+        entries = []
+        entries_last_modified = 0.0
+
+        # ``os.scandir`` raises ``FileNotFoundError`` and ``NotADirectoryError`` by itself
+        with os.scandir(path_with_root) as dir_entries:
+            for dir_entry in dir_entries:
+                entries.append(FileEntry.parse_from_dir_entry(dir_entry))
+                # ``DirEntry.stat()`` caches its result, so this does not stat again
+                entries_last_modified = max(entries_last_modified, dir_entry.stat().st_mtime)
+
+        # Directory mtime does not change if a file in it is modified,
+        # so the entries are included in both the last modified timestamp and the checksum
+        last_modified = max(os.stat(path_with_root).st_mtime, entries_last_modified)
+        checksum = zlib.crc32("\n".join(
+            f"{entry.file_name}\0{entry.display_size_original}\0{entry.modified_utc_str}" for entry in entries
+        ).encode("utf-8", "surrogateescape"))
+
+        return DirectoryListing(entries, last_modified, f"{int(last_modified)}-{len(entries)}-{checksum:08x}")
+
+
+class DirectoryListingCache:
+    """
+    LRU cache of the parsed directory listings, each of which expires after ``TTL_SECONDS``.
+
+    The key is the full path of the directory with the root.
+
+    All operations are guarded by a lock, so the cache can be shared across threads or greenlets.
+    """
+
+    TTL_SECONDS = 30
+    MAX_SIZE = 512
+
+    def __init__(self):
+        self._cache: "OrderedDict[str, Tuple[float, DirectoryListing]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, path: str) -> Optional[DirectoryListing]:
+        """Get the cached listing of ``path``. Returns ``None`` if not cached or expired."""
+        with self._lock:
+            cached = self._cache.get(path)
+            if not cached:
+                return None
+
+            cached_at, listing = cached
+            if time.monotonic() - cached_at >= self.TTL_SECONDS:
+                del self._cache[path]
+                return None
+
+            self._cache.move_to_end(path)
+            return listing
+
+    def set(self, path: str, listing: DirectoryListing):
+        """Cache the listing of ``path``, evicting the least recently used one if the cache is full."""
+        with self._lock:
+            self._cache[path] = (time.monotonic(), listing)
+            self._cache.move_to_end(path)
+
+            while len(self._cache) > self.MAX_SIZE:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        """Clear all cached listings."""
+        with self._lock:
+            self._cache.clear()
+
+
+_listing_cache = DirectoryListingCache()
+
+
+def clear_directory_listing_cache():
+    """Clear all cached directory listings, so the next :func:`get_directory_listing` reads the directory again."""
+    _listing_cache.clear()
+
+
+def get_directory_listing(path: str = "") -> DirectoryListing:
     """
-    Get a :class:`generator` which yields files and directories under the current working directory.
+    Get the listing of files and directories under ``path``.
+
+    The returned listing is cached for ``DirectoryListingCache.TTL_SECONDS``.
 
     :raises FileNotFoundError: path not found
     :raises NotADirectoryError: path is not a directory
     """
-    path = Path(PathInfo(path).full_path_with_root)
+    path_with_root = get_path_info(path).full_path_with_root
 
-    if not path.exists():
-        raise FileNotFoundError(path)
+    listing = _listing_cache.get(path_with_root)
+    if listing is not None:
+        return listing
 
-    if not path.is_dir():
-        raise NotADirectoryError(path)
+    listing = DirectoryListing.parse_from_path(path_with_root)
+    _listing_cache.set(path_with_root, listing)
 
-    for path_in_dir in path.iterdir():
-        yield FileEntry.parse_from_path(path_in_dir)
+    return listing
 
 
 class FileForDownload:
@@ -157,16 +264,26 @@ class FileForDownload:
         :raises FileNotFoundError: file at `path_info` not found
         :raises PathIsDirectoryError: `path_info` is a directory
         """
-        self._path = Path(path_info.full_path_with_root)
+        self._path = os.path.normpath(path_info.full_path_with_root)
+
+        try:
+            file_stats = os.stat(self._path)
+        except NotADirectoryError as ex:
+            # Some parent of the path is a file
+            raise FileNotFoundError(self._path) from ex
 
-        if not self._path.exists():
-            raise FileNotFoundError()
+        if stat.S_ISDIR(file_stats.st_mode):
+            raise IsADirectoryError(self._path)
 
-        if self._path.is_dir():
-            raise IsADirectoryError()
+        self._file_name = os.path.basename(self._path)
+        self._file_size = file_stats.st_size
+        self._last_modified = file_stats.st_mtime
+        self._etag = f"{file_stats.st_mtime_ns:x}-{file_stats.st_size:x}"
 
-        self._file_name = self._path.name
-        self._file_size = self._path.stat().st_size
+    @property
+    def path(self) -> str:
+        """Get the full path of the file with the root."""
+        return self._path
 
     @property
     def file_name(self) -> str:
@@ -179,8 +296,14 @@ class FileForDownload:
         return self._file_size
 
     @property
-    def stream(self) -> BinaryIO:
-        return open(self._path.resolve(strict=True), "rb")
+    def last_modified(self) -> float:
+        """Get the last modified timestamp of the file."""
+        return self._last_modified
+
+    @property
+    def etag(self) -> str:
+        """Get the (strong) ETag of the file, which changes if the file is modified."""
+        return self._etag
 
 
 def retrieve_file(path_info: PathInfo) -> Optional[FileForDownload]:
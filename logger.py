@@ -1,17 +1,26 @@
+import atexit
 import logging
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
 
 __all__ = ("apply_log_config", "log_exception")
 
 from typing import Optional
 
+_log_format = "[%(asctime)s] %(levelname)s in %(module)s: %(message)s"
+_log_queue: Queue = Queue(-1)
+_queue_listener: Optional[QueueListener] = None
+
 
 def apply_log_config():
+    global _queue_listener
+
     dictConfig({
         "version": 1,
         "formatters": {
             "default": {
-                "format": "[%(asctime)s] %(levelname)s in %(module)s: %(message)s",
+                "format": _log_format,
             }
         },
         "handlers": {
@@ -19,21 +28,27 @@ def apply_log_config():
                 "class": "logging.StreamHandler",
                 "stream": "ext://flask.logging.wsgi_errors_stream",
                 "formatter": "default"
-            },
-            "console_handler": {
-                "level": "INFO",
-                "class": "logging.FileHandler",
-                "filename": "logs/console.log",
-                "formatter": "default",
-                "mode": "a"
             }
         },
         "root": {
             "level": "DEBUG",
-            "handlers": ["wsgi", "console_handler"]
+            "handlers": ["wsgi"]
         }
     })
 
+    # Records are written to the file on the listener thread, so logging does not block the request
+    console_handler = QueueHandler(_log_queue)
+    console_handler.setLevel(logging.INFO)
+    logging.getLogger().addHandler(console_handler)
+
+    if not _queue_listener:
+        file_handler = logging.FileHandler("logs/console.log", mode="a")
+        file_handler.setFormatter(logging.Formatter(_log_format))
+
+        _queue_listener = QueueListener(_log_queue, file_handler)
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+
 
 def log_exception(message: Optional[str] = None):
     logging.exception(message)
@@ -1,7 +1,8 @@
 """Path info object."""
-from typing import Generator, Tuple
+from functools import lru_cache
+from typing import Tuple
 
-__all__ = ("PathInfo",)
+__all__ = ("PathInfo", "get_path_info")
 
 
 class PathInfo:
@@ -12,6 +13,8 @@ class PathInfo:
     """
     ROOT = "Y:"
 
+    __slots__ = ("_path", "_crumbs")
+
     def __init__(self, path_without_root: str):
         if not path_without_root.startswith("/"):
             path_without_root = f"/{path_without_root}"
@@ -20,6 +23,17 @@ class PathInfo:
 
         self._path = f"{PathInfo.ROOT}{path_without_root}"
 
+        crumbs = []
+        path_from_root = ""
+        for section in path_without_root.split("/"):
+            if not section:
+                continue
+
+            path_from_root += f"{section}/"
+            crumbs.append((section, path_from_root))
+
+        self._crumbs: Tuple[Tuple[str, str], ...] = tuple(crumbs)
+
     @property
     def full_path_with_root(self) -> str:
         """Get the full path with the configured root. This always starts from ``ROOT`` and ends with "/"."""
@@ -36,7 +50,7 @@ class PathInfo:
         return self.full_path[1:]
 
     @property
-    def full_paths_from_root(self) -> Generator[Tuple[str, str], None, None]:
+    def full_paths_from_root(self) -> Tuple[Tuple[str, str], ...]:
         """
         Get the full paths and the corresponding section from the root to current.
 
@@ -53,11 +67,13 @@ class PathInfo:
         - ``/A/B/``
 
         - ``/A/B/C/``
+
+        These are computed once on initialization.
         """
-        ret = ""
-        for section in self.full_path.split("/"):
-            if not section:
-                continue
+        return self._crumbs
+
 
-            ret += f"{section}/"
-            yield section, ret
+@lru_cache(maxsize=1024)
+def get_path_info(path_without_root: str) -> PathInfo:
+    """Get the :class:`PathInfo` of ``path_without_root``, reusing the one created earlier if available."""
+    return PathInfo(path_without_root)
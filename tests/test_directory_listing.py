@@ -0,0 +1,58 @@
+import os
+
+import file
+from file import DirectoryListing, DirectoryListingCache
+
+
+def test_listing_cache_ttl(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(file.time, "monotonic", lambda: now)
+
+    cache = DirectoryListingCache()
+    listing = object()
+    cache.set("Y:/A/", listing)
+    assert cache.get("Y:/A/") is listing
+
+    now += DirectoryListingCache.TTL_SECONDS - 1
+    assert cache.get("Y:/A/") is listing
+
+    now += 1
+    assert cache.get("Y:/A/") is None
+    assert cache.get("Y:/A/") is None
+
+
+def test_listing_cache_lru_eviction():
+    cache = DirectoryListingCache()
+    cache.MAX_SIZE = 2
+
+    cache.set("Y:/A/", "A")
+    cache.set("Y:/B/", "B")
+    cache.set("Y:/C/", "C")
+
+    assert cache.get("Y:/A/") is None
+    assert cache.get("Y:/B/") == "B"
+    assert cache.get("Y:/C/") == "C"
+
+
+def test_listing_cache_hit_moves_to_end():
+    cache = DirectoryListingCache()
+    cache.MAX_SIZE = 2
+
+    cache.set("Y:/A/", "A")
+    cache.set("Y:/B/", "B")
+    assert cache.get("Y:/A/") == "A"
+
+    cache.set("Y:/C/", "C")
+
+    assert cache.get("Y:/A/") == "A"
+    assert cache.get("Y:/B/") is None
+    assert cache.get("Y:/C/") == "C"
+
+
+def test_listing_last_modified_includes_entries(tmp_path):
+    (tmp_path / "B.mp4").write_bytes(b"B")
+    dir_mtime = os.stat(tmp_path).st_mtime
+    os.utime(tmp_path / "B.mp4", (dir_mtime, dir_mtime + 10))
+
+    listing = DirectoryListing.parse_from_path(str(tmp_path))
+    assert listing.last_modified == dir_mtime + 10
@@ -1,4 +1,11 @@
+import os
+
 from flask import url_for
+from werkzeug.http import http_date, parse_date
+
+import app
+from file import clear_directory_listing_cache
+from path import PathInfo, get_path_info
 
 
 def test_root_redirection(client):
@@ -53,3 +60,130 @@ def test_download_file_in_directory(client):
 def test_download_directory(client):
     resp = client.head(url_for("download", file_path="A"))
     assert resp.status_code == 406
+
+
+def test_download_file_headers(client):
+    resp = client.get(url_for("download", file_path="A/B.mp4"))
+    assert resp.status_code == 200
+    assert resp.headers["Content-Disposition"] == "attachment; filename=B.mp4"
+    assert int(resp.headers["Content-Length"]) == len(resp.data)
+
+
+def test_download_file_range(client):
+    full = client.get(url_for("download", file_path="C.mkv")).data
+
+    resp = client.get(url_for("download", file_path="C.mkv"), headers={"Range": "bytes=100-199"})
+    assert resp.status_code == 206
+    assert resp.headers["Content-Range"] == f"bytes 100-199/{len(full)}"
+    assert resp.data == full[100:200]
+
+
+def test_download_file_range_suffix(client):
+    full = client.get(url_for("download", file_path="C.mkv")).data
+
+    resp = client.get(url_for("download", file_path="C.mkv"), headers={"Range": "bytes=-100"})
+    assert resp.status_code == 206
+    assert resp.data == full[-100:]
+
+
+def test_download_file_range_not_satisfiable(client):
+    resp = client.get(url_for("download", file_path="A/B.mp4"), headers={"Range": "bytes=99999999-"})
+    assert resp.status_code == 416
+
+
+def test_download_file_under_file(client):
+    resp = client.head(url_for("download", file_path="C.mkv/D.mkv"))
+    assert resp.status_code == 404
+
+
+def test_view_directory_render_error(client, monkeypatch):
+    def render_template(*_, **__):
+        raise ValueError("For testing purpose")
+
+    monkeypatch.setattr(app, "render_template", render_template)
+
+    resp = client.get(url_for("get_file_list", file_path="A"))
+    assert resp.status_code == 500
+
+
+def test_view_directory_not_modified(client):
+    resp = client.get(url_for("get_file_list", file_path="A"))
+    assert resp.status_code == 200
+
+    resp = client.get(url_for("get_file_list", file_path="A"), headers={"If-None-Match": resp.headers["ETag"]})
+    assert resp.status_code == 304
+    assert not resp.data
+
+
+def test_view_directory_file_in_it_modified(client, tmp_path, monkeypatch):
+    # Use a temporary root, so the metadata of the actual drive is not touched
+    monkeypatch.setattr(PathInfo, "ROOT", str(tmp_path))
+    get_path_info.cache_clear()
+    clear_directory_listing_cache()
+
+    (tmp_path / "A").mkdir()
+    (tmp_path / "A" / "B.mp4").write_bytes(b"B")
+
+    try:
+        resp = client.get(url_for("get_file_list", file_path="A"))
+        last_modified = resp.headers["Last-Modified"]
+
+        modified_ts = parse_date(last_modified).timestamp() + 10
+        os.utime(tmp_path / "A" / "B.mp4", (modified_ts, modified_ts))
+        clear_directory_listing_cache()
+
+        resp = client.get(url_for("get_file_list", file_path="A"), headers={"If-Modified-Since": last_modified})
+        assert resp.status_code == 200
+        assert resp.headers["Last-Modified"] == http_date(modified_ts)
+    finally:
+        get_path_info.cache_clear()
+        clear_directory_listing_cache()
+
+
+def test_download_file_not_modified(client):
+    original = client.head(url_for("download", file_path="A/B.mp4"))
+    assert original.status_code == 200
+
+    resp = client.get(url_for("download", file_path="A/B.mp4"), headers={"If-None-Match": original.headers["ETag"]})
+    assert resp.status_code == 304
+    assert not resp.data
+
+    resp = client.get(url_for("download", file_path="A/B.mp4"),
+                      headers={"If-Modified-Since": original.headers["Last-Modified"]})
+    assert resp.status_code == 304
+
+
+def test_download_file_range_if_range(client):
+    original = client.head(url_for("download", file_path="C.mkv"))
+
+    resp = client.get(url_for("download", file_path="C.mkv"),
+                      headers={"Range": "bytes=0-9", "If-Range": original.headers["ETag"]})
+    assert resp.status_code == 206
+    assert len(resp.data) == 10
+
+    resp = client.get(url_for("download", file_path="C.mkv"),
+                      headers={"Range": "bytes=0-9", "If-Range": original.headers["Last-Modified"]})
+    assert resp.status_code == 206
+
+
+def test_download_file_range_if_range_stale(client):
+    original = client.head(url_for("download", file_path="C.mkv"))
+
+    resp = client.get(url_for("download", file_path="C.mkv"),
+                      headers={"Range": "bytes=0-9", "If-Range": '"stale-etag"'})
+    assert resp.status_code == 200
+    assert "Content-Range" not in resp.headers
+    assert len(resp.data) == int(original.headers["Content-Length"])
+
+    resp = client.get(url_for("download", file_path="C.mkv"),
+                      headers={"Range": "bytes=0-9", "If-Range": "Thu, 01 Jan 1970 00:00:00 GMT"})
+    assert resp.status_code == 200
+
+
+def test_download_file_range_if_range_weak(client):
+    original = client.head(url_for("download", file_path="C.mkv"))
+
+    resp = client.get(url_for("download", file_path="C.mkv"),
+                      headers={"Range": "bytes=0-9", "If-Range": f"W/{original.headers['ETag']}"})
+    assert resp.status_code == 200
+    assert len(resp.data) == int(original.headers["Content-Length"])
@@ -0,0 +1,10 @@
+from file import FileSize
+
+
+def test_file_size_formatted():
+    assert FileSize(0).formatted == "0.0 B"
+    assert FileSize(1023).formatted == "1,023.0 B"
+    assert FileSize(1024).formatted == "1.0 KB"
+    assert FileSize(23095254).formatted == "22.0 MB"
+    assert FileSize(1024 ** 5).formatted == "1,024.0 TB"
+